@@ -1,15 +1,29 @@
 import streamlit as st
 import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yaml
 import hashlib
+import json
+import sqlite3
+import time
+import html
 import urllib.parse
-from datetime import datetime, timezone, date
-from bs4 import BeautifulSoup
+from datetime import datetime, timezone, date, timedelta
 import math
+from email.utils import parsedate_to_datetime
+import numpy as np
+import pandas as pd
 from dateutil import parser as dparser
 from urllib.parse import urlparse, parse_qs, urlunparse
 import re
 from rapidfuzz import fuzz
+import ahocorasick
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO
+from lxml import etree
+import lxml.html
 
 st.set_page_config(page_title="Maritime Latest News", layout="wide")
 
@@ -31,6 +45,7 @@ st.markdown("""
   min-height: 100%;
 }
 .news-card:hover { transform: translateY(-1px); }
+.news-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(300px, 1fr)); gap: 1rem; }
 .news-title { font-size: 1.15rem; font-weight: 700; line-height: 1.25; margin: 6px 0 6px 0; }
 .news-meta { color: #6b7280; font-size: 0.9rem; margin-bottom: 6px; }
 .news-summary { color: #374151; font-size: .95rem; }
@@ -64,14 +79,21 @@ ALL_TOPICS   = sorted(list(topic_config.get("topics", {}).keys()))
 DOMAIN_BLOCKLIST = set(feed_config.get("domain_blocklist", []) or [])
 DOMAIN_WEIGHTS   = {k.lower(): float(v) for k, v in (feed_config.get("domain_weights", {}) or {}).items()}
 AGGREGATORS      = {"news.google.com", "news.yahoo.com", "finance.yahoo.com", "feedproxy.google.com"}
+FETCH_WORKERS    = max(1, int(feed_config.get("fetch_workers", 32) or 32))
+FEED_CACHE_PATH  = feed_config.get("feed_cache_path", ".feedcache.sqlite3")
 
 # =========================
 # Utilities
 # =========================
+TAG_RE = re.compile(r"<[A-Za-z/!][^>]*>")  # real tag starts only; "<200 USD" is text
+
 def clean(text):
+    """Strip tags/entities from short feed fields without building a parse tree."""
     s = str(text or "")
-    if "<" in s and ">" in s:
-        return BeautifulSoup(s, "html.parser").get_text().strip()
+    if "<" in s:
+        s = TAG_RE.sub("", s)
+    if "&" in s:
+        s = html.unescape(s)
     return s.strip()
 
 def parse_date_safe(s: str) -> datetime:
@@ -83,6 +105,23 @@ def parse_date_safe(s: str) -> datetime:
     except Exception:
         return datetime.now(timezone.utc)
 
+def entry_datetime(entry) -> datetime:
+    """Publication time via the cheap structured paths; fuzzy dateutil only as last resort."""
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if parsed:  # feedparser fallback already did the work (struct_time, UTC)
+        return datetime(*parsed[:6], tzinfo=timezone.utc)
+    s = (entry.get("published") or entry.get("updated") or "").strip()
+    if not s:
+        return datetime.now(timezone.utc)
+    try:
+        if s[0].isdigit():  # Atom / dc:date: ISO 8601
+            dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        else:               # RSS pubDate: RFC 822
+            dt = parsedate_to_datetime(s)
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    except (ValueError, TypeError, IndexError):
+        return parse_date_safe(s)
+
 def get_domain(u: str) -> str:
     try:
         return urlparse(u).netloc.lower().replace("www.", "")
@@ -151,8 +190,10 @@ def normalize_title(title: str) -> str:
     t = PUNCT_RE.sub("", t).lower().strip()
     return t
 
-def article_id(title: str, link: str) -> str:
-    return hashlib.sha1(f"{normalize_title(title)}::{link}".encode("utf-8")).hexdigest()
+def article_id(norm_title: str, link: str) -> str:
+    """Dedup/widget key from an already-normalized title (see normalize_title)."""
+    # not a security hash: blake2b beats SHA-1 on short inputs; 128 bits is plenty here
+    return hashlib.blake2b(f"{norm_title}::{link}".encode("utf-8"), digest_size=16).hexdigest()
 
 # =========================
 # Topic matching (incl. ports logic from previous step)
@@ -169,19 +210,75 @@ PORTS_TECH_STRONG = {
     "quay crane","sts crane","rtg","rmg","asc","straddle carrier","reachstacker","agv","automated guided vehicle",
     "5g port","gate automation","pcs","port community system"
 }
-
-def _contains(text_lower: str, phrase: str) -> bool:
-    p = phrase.strip()
-    if not p:
-        return False
-    if len(p) <= 3 and p.replace("-", "").isalpha():
-        return re.search(rf"\b{re.escape(p)}\b", text_lower, flags=re.IGNORECASE) is not None
-    return p.lower() in text_lower
+PORTS_DEVELOPMENT = ["port expansion","terminal concession","berth expansion","quay wall"]
+# Plain substring semantics, one C-level scan each instead of a Python any() loop
+PORTS_CONTEXT_RE     = re.compile("|".join(map(re.escape, sorted(PORTS_CONTEXT))))
+PORTS_DEVELOPMENT_RE = re.compile("|".join(map(re.escape, PORTS_DEVELOPMENT)))
+
+def _is_short_word(p: str) -> bool:
+    return len(p) <= 3 and p.replace("-", "").isalpha()
+
+def compile_phrases(phrases: list[str]):
+    """One alternation regex for a phrase list (short words whole-word only), or None."""
+    parts = []
+    for ph in phrases:
+        p = ph.strip().lower()
+        if p:
+            parts.append(rf"\b{re.escape(p)}\b" if _is_short_word(p) else re.escape(p))
+    return re.compile("|".join(parts)) if parts else None
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+@st.cache_resource
+def build_topic_automaton(topics: dict):
+    """One Aho-Corasick automaton over every include keyword of every topic."""
+    owners = {}
+    for topic, data in topics.items():
+        for kw in (data or {}).get("include", []) or []:
+            p = kw.strip().lower()
+            if p and topic not in owners.setdefault(p, []):
+                owners[p].append(topic)
+    automaton = ahocorasick.Automaton()
+    for p, owner_topics in owners.items():
+        automaton.add_word(p, (p, owner_topics))
+    automaton.make_automaton()
+    return automaton
+
+TOPIC_AUTOMATON = build_topic_automaton(topic_config.get("topics", {}) or {})
+
+# Loop-invariant per-topic data, built once: (topic, exclude_regex_or_None, is_ports_topic)
+TOPIC_RULES = [
+    (
+        topic,
+        compile_phrases((data or {}).get("exclude", []) or []),
+        topic.lower().startswith("ports and port"),
+    )
+    for topic, data in (topic_config.get("topics", {}) or {}).items()
+]
+
+def include_hits(text_lower: str) -> dict:
+    """Single pass over the text -> {topic: [matched include keywords, lowercased]}."""
+    hits = {}
+    if TOPIC_AUTOMATON.kind != ahocorasick.AHOCORASICK:
+        return hits
+    for end, (p, owner_topics) in TOPIC_AUTOMATON.iter(text_lower):
+        if _is_short_word(p):
+            start = end - len(p) + 1
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if end + 1 < len(text_lower) and _is_word_char(text_lower[end + 1]):
+                continue
+        for topic in owner_topics:
+            topic_hits = hits.setdefault(topic, [])
+            if p not in topic_hits:
+                topic_hits.append(p)
+    return hits
 
 def ports_score_and_flag(text_lower: str, hits: list[str]) -> tuple[float, bool]:
-    dredging_hit = any("dredging" in h.lower() for h in hits)
-    tech_hit = any(h.lower() in PORTS_TECH_STRONG for h in hits)
-    context_ok = any(w in text_lower for w in PORTS_CONTEXT)
+    dredging_hit = any("dredging" in h for h in hits)
+    tech_hit = any(h in PORTS_TECH_STRONG for h in hits)
+    context_ok = PORTS_CONTEXT_RE.search(text_lower) is not None
     score = 1.0
     if tech_hit: score += 1.2
     if context_ok: score += 0.4
@@ -189,27 +286,43 @@ def ports_score_and_flag(text_lower: str, hits: list[str]) -> tuple[float, bool]
     if dredging_hit and not tech_hit:
         score -= 0.8
         dredging_only = True
-    if dredging_hit and any(k in text_lower for k in ["port expansion","terminal concession","berth expansion","quay wall"]):
+    if dredging_hit and PORTS_DEVELOPMENT_RE.search(text_lower):
         score += 0.3
         dredging_only = False
     return score, dredging_only
 
+CLASSIFY_MEMO_MAX = 50_000
+
+@st.cache_resource
+def classification_memo(topics: dict) -> dict:
+    """text -> (topics, meta) across refreshes; keyed on the topic config, so editing
+    topics.yaml starts a fresh memo automatically."""
+    return {}
+
+CLASSIFY_MEMO = classification_memo(topic_config.get("topics", {}) or {})
+
 def matched_topics_for(text: str) -> tuple[list, dict]:
+    hit = CLASSIFY_MEMO.get(text)
+    if hit is None:
+        if len(CLASSIFY_MEMO) >= CLASSIFY_MEMO_MAX:
+            CLASSIFY_MEMO.clear()
+        hit = CLASSIFY_MEMO[text] = _classify(text)
+    return list(hit[0]), dict(hit[1])
+
+def _classify(text: str) -> tuple[list, dict]:
     tl = text.lower()
     matched = []
     meta = {}
-    for topic, data in topic_config.get("topics", {}).items():
-        includes = data.get("include", []) or []
-        excludes = data.get("exclude", []) or []
-        if any(_contains(tl, ex) for ex in excludes):
-            continue
-        hits = [kw for kw in includes if _contains(tl, kw)]
+    hits_by_topic = include_hits(tl)
+    for topic, exclude_re, is_ports in TOPIC_RULES:
+        hits = hits_by_topic.get(topic)
         if not hits:
             continue
-        if topic.lower().startswith("ports and port"):
-            ambig_hits = [h for h in hits if h.lower() in PORTS_AMBIGUOUS]
-            non_ambig_hits = [h for h in hits if h.lower() not in PORTS_AMBIGUOUS]
-            if non_ambig_hits or any(w in tl for w in PORTS_CONTEXT):
+        if exclude_re is not None and exclude_re.search(tl):
+            continue
+        if is_ports:
+            non_ambig_hits = [h for h in hits if h not in PORTS_AMBIGUOUS]
+            if non_ambig_hits or PORTS_CONTEXT_RE.search(tl):
                 matched.append(topic)
                 score, dredging_only = ports_score_and_flag(tl, hits)
                 meta["ports_score"] = score
@@ -218,11 +331,180 @@ def matched_topics_for(text: str) -> tuple[list, dict]:
             matched.append(topic)
     return matched, meta
 
+# =========================
+# Feed parsing (lxml fast path, feedparser fallback)
+# =========================
+ATOM_NS    = "{http://www.w3.org/2005/Atom}"
+RSS1_NS    = "{http://purl.org/rss/1.0/}"
+DC_DATE    = "{http://purl.org/dc/elements/1.1/}date"
+MEDIA_NS   = "{http://search.yahoo.com/mrss/}"
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+FEED_ITEM_TAGS = ("item", f"{RSS1_NS}item", f"{ATOM_NS}entry")
+
+def _text_of(el, *tags) -> str:
+    for tag in tags:
+        child = el.find(tag)
+        if child is None:
+            continue
+        if child.get("type") == "xhtml":
+            return "".join(etree.tostring(c, encoding="unicode") for c in child)
+        if child.text:
+            return child.text
+    return ""
+
+def _media_urls(el, tag: str) -> list[dict]:
+    return [{"url": m.get("url")} for m in el.iter(f"{MEDIA_NS}{tag}") if m.get("url")]
+
+def _entry_from_element(el) -> dict:
+    """Map an RSS <item> / Atom <entry> onto the feedparser keys used downstream."""
+    if el.tag == f"{ATOM_NS}entry":
+        links = [{"href": l.get("href"), "rel": l.get("rel", "alternate")} for l in el.findall(f"{ATOM_NS}link") if l.get("href")]
+        link = next((l["href"] for l in links if l["rel"] == "alternate"), links[0]["href"] if links else "")
+        content = _text_of(el, f"{ATOM_NS}content")
+        entry = {
+            "title": _text_of(el, f"{ATOM_NS}title"),
+            "summary": _text_of(el, f"{ATOM_NS}summary"),
+            "link": link,
+            "links": links,
+            "published": _text_of(el, f"{ATOM_NS}published"),
+            "updated": _text_of(el, f"{ATOM_NS}updated"),
+        }
+    else:
+        ns = RSS1_NS if el.tag.startswith(RSS1_NS) else ""
+        link = _text_of(el, f"{ns}link").strip()
+        if not link:  # like feedparser: a guid is the permalink unless isPermaLink="false"
+            guid = el.find("guid")
+            if guid is not None and guid.get("isPermaLink", "true").lower() != "false":
+                link = (guid.text or "").strip()
+        content = _text_of(el, f"{CONTENT_NS}encoded")
+        entry = {
+            "title": _text_of(el, f"{ns}title"),
+            "summary": _text_of(el, f"{ns}description"),
+            "link": link,
+            "links": [{"href": link, "rel": "alternate"}] if link else [],
+            "published": _text_of(el, "pubDate", DC_DATE),
+            "updated": "",
+        }
+        src = el.find("source")
+        if src is not None and src.get("url"):
+            entry["source"] = {"href": src.get("url"), "title": src.text or ""}
+    if content:
+        entry["content"] = [{"value": content}]
+        entry["summary"] = entry["summary"] or content  # feedparser does the same
+    entry["media_content"] = _media_urls(el, "content")
+    entry["media_thumbnail"] = _media_urls(el, "thumbnail")
+    return entry
+
+def parse_feed_entries(raw: bytes) -> list[dict]:
+    """Stream items out of the XML and free each one as we go; fall back to feedparser
+    for anything lxml rejects or does not recognise (malformed XML, exotic dialects)."""
+    entries = []
+    try:
+        for _, el in etree.iterparse(BytesIO(raw), events=("end",), tag=FEED_ITEM_TAGS,
+                                     resolve_entities=False, no_network=True):
+            entries.append(_entry_from_element(el))
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+    except etree.LxmlError:
+        entries = []
+    if entries:
+        return entries
+    try:
+        d = feedparser.parse(raw)
+    except Exception:
+        return []
+    if getattr(d, "bozo", 0) and not getattr(d, "entries", []):
+        return []
+    return d.entries
+
 # =========================
 # Fetch, classify, deduplicate (cached)
 # =========================
-@st.cache_data(show_spinner=True, ttl=600)
-def fetch_all_articles(max_age_days: int = 30):
+FEED_TIMEOUT = 10
+SUMMARY_PREVIEW_CHARS = 300  # shared by the cards and the Markdown export
+USER_AGENT   = "Mozilla/5.0 (compatible; MaritimeNewsCurator/1.0)"
+
+@st.cache_resource
+def http_session() -> requests.Session:
+    """One pooled session per process; retries 5xx with backoff."""
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504), allowed_methods=("GET",))
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=FETCH_WORKERS, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+NOT_MODIFIED = object()  # fetch_feed_bytes() result for a 304
+
+FEED_CACHE_FRESH_SECS = 600  # same horizon as the load_feed_items ttl
+
+@st.cache_resource
+def feed_http_cache() -> dict:
+    """Process-wide url -> {"etag", "modified", "entries"} from the last 200 response.
+
+    Seeded from the on-disk copy so a restarted process starts warm; rows carry their
+    crawl time ("ts") until first use.
+    """
+    try:
+        with sqlite3.connect(FEED_CACHE_PATH) as con:
+            rows = con.execute("SELECT url, etag, modified, entries, ts FROM feed_cache").fetchall()
+    except sqlite3.Error:
+        return {}
+    return {
+        url: {"etag": etag, "modified": modified, "entries": json.loads(entries), "ts": ts}
+        for url, etag, modified, entries, ts in rows
+    }
+
+def persist_feed_cache(http_cache: dict, urls: list[str]):
+    """Write the given feeds' cache rows to disk; best effort (read-only disks just skip it)."""
+    now = time.time()
+    rows = [
+        (u, http_cache[u].get("etag"), http_cache[u].get("modified"), json.dumps(http_cache[u]["entries"], default=str), now)
+        for u in urls if "entries" in http_cache.get(u, {})
+    ]
+    if not rows:
+        return
+    try:
+        with sqlite3.connect(FEED_CACHE_PATH) as con:
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS feed_cache "
+                "(url TEXT PRIMARY KEY, etag TEXT, modified TEXT, entries TEXT, ts REAL)"
+            )
+            con.executemany("INSERT OR REPLACE INTO feed_cache VALUES (?, ?, ?, ?, ?)", rows)
+    except sqlite3.Error:
+        pass
+
+def fetch_feed_bytes(session: requests.Session, url: str, http_cache: dict):
+    """Conditional GET. Returns (body, etag, modified), NOT_MODIFIED (reuse the cached
+    entries), or None. Never writes http_cache: the main thread publishes a complete
+    {"etag", "modified", "entries"} record only once the body has been parsed."""
+    prev = http_cache.get(url) or {}
+    if "entries" not in prev:
+        prev = {}  # validators without parsed entries would turn a 304 into an empty feed
+    # warm start: a crawl from a previous process that is still fresh skips the network once
+    # (read-only here; the main thread drops "ts" when it consumes the result)
+    if time.time() - (prev.get("ts") or 0) < FEED_CACHE_FRESH_SECS and "entries" in prev:
+        return NOT_MODIFIED
+    headers = {}
+    if prev.get("etag"):
+        headers["If-None-Match"] = prev["etag"]
+    if prev.get("modified"):
+        headers["If-Modified-Since"] = prev["modified"]
+    try:
+        r = session.get(url, timeout=FEED_TIMEOUT, headers=headers)
+        if r.status_code == 304:
+            # only trust a 304 we asked for; an unsolicited one carries no body to parse
+            return NOT_MODIFIED if headers else None
+        r.raise_for_status()
+    except requests.RequestException:
+        return None
+    return r.content, r.headers.get("ETag"), r.headers.get("Last-Modified")
+
+@st.cache_data(show_spinner="Fetching feeds…", ttl=600)
+def load_feed_items() -> list[dict]:
+    """Fetch, parse and classify every feed once; independent of the sidebar filters."""
     feeds   = feed_config.get("feeds", [])
     queries = feed_config.get("google_news_queries", [])
     google_feeds = [
@@ -234,23 +516,45 @@ def fetch_all_articles(max_age_days: int = 30):
     items = []
     seen_ids = set()
 
-    for url in urls:
-        try:
-            d = feedparser.parse(url)
-        except Exception:
-            continue
-        if getattr(d, "bozo", 0) and not getattr(d, "entries", []):
-            continue
-
-        for entry in d.entries:
+    # Retrieve concurrently (latency-bound), parse serially (memory-bound) on this thread.
+    # Each feed is parsed as soon as its download lands, overlapping with slower feeds.
+    session = http_session()
+    http_cache = feed_http_cache()
+    parsed = [[] for _ in urls]  # kept in config order so dedupe stays deterministic
+    downloaded = []              # feeds with a new 200 body, written back to disk
+    # one in-flight request per feed (up to FETCH_WORKERS); workers just block on sockets
+    with ThreadPoolExecutor(max_workers=max(1, min(FETCH_WORKERS, len(urls)))) as ex:
+        futures = {ex.submit(fetch_feed_bytes, session, u, http_cache): i for i, u in enumerate(urls)}
+        for fut in as_completed(futures):
+            try:
+                raw = fut.result()
+            except Exception:
+                continue
+            i = futures[fut]
+            if raw is NOT_MODIFIED:
+                parsed[i] = http_cache[urls[i]]["entries"]  # 304: skip the download *and* the parse
+                http_cache[urls[i]].pop("ts", None)  # a warm-start row is served from disk only once
+            elif raw is not None:
+                body, etag, modified = raw
+                parsed[i] = parse_feed_entries(body)
+                # publish validators and entries together, only after a successful parse
+                http_cache[urls[i]] = {"etag": etag, "modified": modified, "entries": parsed[i]}
+                downloaded.append(urls[i])
+    persist_feed_cache(http_cache, downloaded)
+
+    for entries in parsed:
+        for entry in entries:
             raw_title = clean(entry.get("title", ""))
             summary   = clean(entry.get("summary", ""))
             link      = get_best_link_from_entry(entry)
-            pub_dt    = parse_date_safe(entry.get("published") or entry.get("updated") or "")
 
-            # server-side age filter
-            age_days = (datetime.now(timezone.utc) - pub_dt).total_seconds() / 86400.0
-            if age_days > max_age_days:
+            # Cross-posted stories (publisher RSS + Google News) share an id. A repeat with the
+            # same raw date can never change which copy survives the age cut, so drop it before
+            # classification; differently dated copies are kept and resolved in fetch_all_articles.
+            norm_title = normalize_title(raw_title)
+            aid = article_id(norm_title, link)
+            seen_key = (aid, entry.get("published") or entry.get("updated") or "")
+            if seen_key in seen_ids:
                 continue
 
             dom = get_domain(link)
@@ -262,20 +566,23 @@ def fetch_all_articles(max_age_days: int = 30):
             if not topics:
                 continue
 
-            aid = article_id(raw_title, link)
-            if aid in seen_ids:
-                continue
-            seen_ids.add(aid)
+            pub_dt    = entry_datetime(entry)
 
+            seen_ids.add(seen_key)  # only kept copies count: a rejected first copy mustn't hide a later one
             items.append({
                 "id": aid,
                 "title": raw_title,
-                "norm_title": normalize_title(raw_title),
+                "norm_title": norm_title,
                 "summary": summary,
+                "summary_preview": summary[:SUMMARY_PREVIEW_CHARS],
                 "link": link,
                 "date": pub_dt.isoformat(),
+                "date_short": pub_dt.date().isoformat(),
                 "date_dt": pub_dt,
                 "topics": topics,
+                # frozen display strings: built once per article, not once per card render
+                "topics_str": ", ".join(topics),
+                "chips_html": " ".join(f'<span class="badge">{html.escape(t)}</span>' for t in topics[:3]),
                 "image": extract_image(entry) or "",
                 "domain": dom,
                 "source_weight": DOMAIN_WEIGHTS.get(dom, 1.0),
@@ -284,8 +591,84 @@ def fetch_all_articles(max_age_days: int = 30):
                 "ports_dredging_only": meta.get("ports_dredging_only", False),
             })
 
+    return items
+
+@st.cache_data(show_spinner=False, ttl=600)
+def fetch_all_articles(max_age_days: int = 30):
+    """Age-filter + dedupe over the cached feed items; no network or parsing here."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    items = []
+    seen_ids = set()
+    for it in load_feed_items():
+        # age cut first, then id dedupe: an out-of-window copy must not hide an in-window one
+        if it["date_dt"] >= cutoff and it["id"] not in seen_ids:
+            seen_ids.add(it["id"])
+            items.append(it)
     return deduplicate_articles(items)
 
+ARTICLE_COLUMNS = [
+    "id", "title", "norm_title", "summary", "summary_preview", "link", "date", "date_short", "date_dt", "topics", "topics_str",
+    "chips_html", "image", "domain", "source_weight", "is_aggregator", "ports_score", "ports_dredging_only",
+]
+# tie-break order used by "Newest first" / "Oldest first"
+SORT_COLUMNS = ["date_dt", "source_weight", "non_aggregator", "ports_score"]
+
+# One bit per topic in a uint64 membership mask. Beyond 64 topics the bits would not fit,
+# so larger configs fall back to one boolean membership column per topic.
+TOPIC_BITMASK = len(ALL_TOPICS) <= 64
+TOPIC_BITS = {topic: 1 << i for i, topic in enumerate(ALL_TOPICS)} if TOPIC_BITMASK else {}
+
+def topic_bits(topics) -> int:
+    return sum(TOPIC_BITS.get(t, 0) for t in topics)
+
+def topic_column(topic: str) -> str:
+    return f"topic::{topic}"
+
+def card_html(article: dict) -> str:
+    """The whole static card as one escaped HTML block; built once per article in articles_frame."""
+    esc = html.escape
+    img_html = ""
+    if article.get("image"):  # lazy + async decode: off-screen thumbnails never block first paint
+        img_html = f'<div class="news-thumb"><img src="{esc(article["image"])}" loading="lazy" decoding="async" style="width:100%;height:auto"></div>'
+    chips_html = f'{article["chips_html"]}<hr class="soft">' if article["chips_html"] else ""
+    # collapse whitespace: a blank line would end the HTML block inside st.markdown
+    summary = esc(" ".join(article["summary_preview"].split()))
+    return (
+        f'<div class="news-card">{img_html}'
+        f'<div class="news-title">{esc(article["title"])}</div>'
+        f'<div class="news-meta">📅 {article["date_short"]} &nbsp;&nbsp;•&nbsp;&nbsp; 🔖 {esc(article.get("domain", ""))}</div>'
+        f'{chips_html}'
+        f'<div class="news-summary">{summary}...</div>'
+        f'<a href="{esc(article["link"])}" target="_blank">🔗 Read more</a>'
+        '</div>'
+    )
+
+@st.cache_resource(show_spinner=False, ttl=600)
+def articles_frame(max_age_days: int) -> pd.DataFrame:
+    """Columnar (one row per article) view used for filtering, sorting and paging.
+
+    A shared resource, not cache_data: reruns get this very object instead of unpickling
+    every row (card markup included). Treat it as read-only; callers slice, never mutate.
+    """
+    records = fetch_all_articles(max_age_days=max_age_days)
+    df = pd.DataFrame(records, columns=ARTICLE_COLUMNS)
+    # articles are immutable once fetched, so their card markup is too
+    df["card_html"] = [card_html(a) for a in records]
+    df["date_dt"] = pd.to_datetime(df["date_dt"], utc=True)
+    # the article's own calendar day (what the card shows), tz-naive, for the date window
+    df["date_day"] = pd.to_datetime(df["date_short"])
+    df["non_aggregator"] = ~df["is_aggregator"].astype(bool)
+    # Topic buckets, built once per frame: the article's topics as a bitmask
+    if TOPIC_BITMASK:
+        df["topic_bits"] = np.fromiter((topic_bits(ts) for ts in df["topics"]), dtype=np.uint64, count=len(df))
+    else:
+        for topic in ALL_TOPICS:
+            df[topic_column(topic)] = df["topics"].map(lambda ts, t=topic: t in ts).astype(bool)
+    # Unique per build: caches derived from this frame (row positions) key on it, so a
+    # rebuilt frame can never be indexed with another build's positions
+    df.attrs["version"] = f"{time.time_ns():x}-{len(df)}"
+    return df
+
 def deduplicate_articles(items: list) -> list:
     if not items:
         return items
@@ -302,15 +685,12 @@ def deduplicate_articles(items: list) -> list:
     )
 
     kept = []
+    kept_links = set()
     for art in items_sorted:
         duplicate = False
 
-        # Exact-link dedupe
-        for k in kept:
-            if art["link"] == k["link"]:
-                duplicate = True
-                break
-        if duplicate:
+        # Exact-link dedupe (canonicalized links, O(1) lookup); a missing link is no key
+        if art["link"] and art["link"] in kept_links:
             continue
 
         # Same-domain fuzzy title dedupe
@@ -333,10 +713,13 @@ def deduplicate_articles(items: list) -> list:
                 else:
                     # rare case: we kept aggregator earlier; replace with original
                     kept.remove(k)
+                    kept_links.discard(k["link"])
                     break
 
         if not duplicate:
             kept.append(art)
+            if art["link"]:
+                kept_links.add(art["link"])
 
     # Final order for display
     kept = sorted(
@@ -351,9 +734,66 @@ def deduplicate_articles(items: list) -> list:
     )
     return kept
 
+@st.cache_resource(max_entries=4)
+def articles_by_id(_df: pd.DataFrame, frame_version: str) -> dict:
+    """id -> article record of exactly this frame build; shared, not copied, across reruns."""
+    return {a["id"]: a for a in _df.to_dict("records")}
+
+# =========================
+# Filter + sort client-side (vectorized over the article frame)
+# =========================
+def filter_mask(df: pd.DataFrame, topics: tuple, start_date, end_date) -> pd.Series:
+    mask = pd.Series(True, index=df.index)
+    # every stored article has at least one topic, so selecting all topics filters nothing
+    if topics and len(topics) < len(ALL_TOPICS):
+        if TOPIC_BITMASK:
+            mask &= (df["topic_bits"].to_numpy() & np.uint64(topic_bits(topics))) != 0
+        else:
+            mask &= df[[topic_column(t) for t in topics]].any(axis=1)
+    if start_date and end_date:
+        # datetime64 comparisons stay in NumPy (.dt.date would box a Python date per row);
+        # compared on the publisher-local day, like the card's date
+        lo = pd.Timestamp(start_date)
+        hi = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+        mask &= (df["date_day"] >= lo) & (df["date_day"] < hi)
+    return mask
+
+def apply_sort(df: pd.DataFrame, sort_by: str) -> pd.DataFrame:
+    if sort_by == "Newest first":
+        return df.sort_values(SORT_COLUMNS, ascending=False, kind="stable")
+    if sort_by == "Oldest first":
+        return df.sort_values(SORT_COLUMNS, ascending=[True, False, False, False], kind="stable")
+    return df.sort_values("title", key=lambda s: s.str.lower(), kind="stable")
+
+@st.cache_data(show_spinner=False, ttl=600)
+def sorted_positions(_df: pd.DataFrame, frame_version: str, sort_by: str):
+    """Row positions of the whole frame in sort order; sorted once per frame and sort mode."""
+    return apply_sort(_df, sort_by).index.to_numpy()  # RangeIndex: labels double as positions
+
+@st.cache_data(show_spinner=False, ttl=600)
+def view_positions(_df: pd.DataFrame, frame_version: str, topics: tuple, start_date, end_date, sort_by: str):
+    """Row positions into _df of the filtered+sorted view; paging/starring reruns reuse them.
+
+    _df is not hashed (leading underscore); frame_version (_df.attrs["version"]) stands in
+    for it in the cache key.
+    """
+    order = sorted_positions(_df, frame_version, sort_by)
+    # a stable sort of a subset is that subset of the stable sort: filter changes never re-sort
+    keep = filter_mask(_df, topics, start_date, end_date).to_numpy()
+    return order[keep[order]]
+
 # =========================
 # Image extraction
 # =========================
+def first_img_src(fragment: str) -> str:
+    """src of the first <img>, straight from lxml's C parser (no BeautifulSoup tree)."""
+    if not fragment or "<img" not in fragment.lower():
+        return ""
+    try:
+        return lxml.html.fromstring(fragment).xpath("string((//img)[1]/@src)")
+    except (etree.LxmlError, ValueError):
+        return ""
+
 def extract_image(entry):
     media = entry.get("media_content", [])
     if isinstance(media, list) and media and media[0].get("url"):
@@ -361,15 +801,14 @@ def extract_image(entry):
     thumbs = entry.get("media_thumbnail", [])
     if isinstance(thumbs, list) and thumbs and thumbs[0].get("url"):
         return thumbs[0]["url"]
-    if entry.get("summary"):
-        img = BeautifulSoup(entry["summary"], "html.parser").find("img")
-        if img and img.get("src"):
-            return img["src"]
+    summary_html = entry.get("summary") or ""
+    src = first_img_src(summary_html)
+    if src:
+        return src
     if entry.get("content"):
-        html = entry["content"][0].get("value", "")
-        img = BeautifulSoup(html, "html.parser").find("img")
-        if img and img.get("src"):
-            return img["src"]
+        content_html = entry["content"][0].get("value", "")
+        if content_html != summary_html:  # summary often *is* the content; don't parse it twice
+            return first_img_src(content_html)
     return ""
 
 # =========================
@@ -397,8 +836,10 @@ def render_pagination(total_pages: int, state_key: str = "page", window: int = 2
     slots = 2 + len(pages)
     cols = st.columns(slots)
 
-    if cols[0].button("‹ Prev", key=f"{key_prefix}{state_key}_prev", disabled=(current == 1)):
-        set_page(current - 1)
+    # on_click runs before the rerun renders, so the highlighted page, the disabled
+    # Prev/Next state and the grid all agree on the page that was just clicked
+    cols[0].button("‹ Prev", key=f"{key_prefix}{state_key}_prev", disabled=(current == 1),
+                   on_click=set_page, args=(current - 1,))
 
     idx = 1
     for p in pages:
@@ -408,14 +849,14 @@ def render_pagination(total_pages: int, state_key: str = "page", window: int = 2
             if p == current:
                 cols[idx].markdown(f'<span class="btn active">{p}</span>', unsafe_allow_html=True)
             else:
-                if cols[idx].button(str(p), key=f"{key_prefix}{state_key}_{p}"):
-                    set_page(p)
+                cols[idx].button(str(p), key=f"{key_prefix}{state_key}_{p}", on_click=set_page, args=(p,))
         idx += 1
 
-    if cols[-1].button("Next ›", key=f"{key_prefix}{state_key}_next", disabled=(current == total_pages)):
-        set_page(current + 1)
+    cols[-1].button("Next ›", key=f"{key_prefix}{state_key}_next", disabled=(current == total_pages),
+                    on_click=set_page, args=(current + 1,))
+    st.caption(f"Page {current} of {total_pages}")
 
-    return st.session_state[state_key]
+    return current
 
 # =========================
 # UI – Sidebar filters
@@ -441,35 +882,23 @@ with st.sidebar:
 
     sort_by = st.selectbox("Sort by", ["Newest first", "Oldest first", "Title A→Z"])
     max_age_days = st.slider("Max article age (days)", 1, 60, 30)
-    refresh_clicked = st.button("🔄 Refresh News")
-
-# Fetch data (cached)
-if refresh_clicked or "all_articles" not in st.session_state:
-    st.session_state["all_articles"] = fetch_all_articles(max_age_days=max_age_days)
-articles = st.session_state["all_articles"]
-
-# =========================
-# Filter + sort client-side
-# =========================
-def date_in_window(dt: datetime, start_d: date, end_d: date) -> bool:
-    d = dt.date()
-    return (d >= start_d) and (d <= end_d)
-
-def passes_filters(a: dict) -> bool:
-    if choose_topics and not any(t in choose_topics for t in a["topics"]):
-        return False
-    if start_date and end_date and not date_in_window(a["date_dt"], start_date, end_date):
-        return False
-    return True
-
-def apply_sort(items: list[dict]) -> list[dict]:
-    if sort_by == "Newest first":
-        return sorted(items, key=lambda x: (x["date_dt"], x.get("source_weight", 1.0), 1 if not x.get("is_aggregator") else 0, x.get("ports_score", 1.0)), reverse=True)
-    if sort_by == "Oldest first":
-        return sorted(items, key=lambda x: (x["date_dt"], -x.get("source_weight", 1.0), - (1 if not x.get("is_aggregator") else 0), -x.get("ports_score", 1.0)))
-    return sorted(items, key=lambda x: x["title"].lower())
-
-filtered = apply_sort([a for a in articles if passes_filters(a)])
+    if st.button("🔄 Refresh News"):
+        # Drop the memoized fetch so this run re-polls every feed (unchanged feeds answer 304)
+        load_feed_items.clear()
+        fetch_all_articles.clear()
+        articles_frame.clear()
+        sorted_positions.clear()
+        articles_by_id.clear()
+        view_positions.clear()
+
+# Fetch data (memoized per max_age_days for 10 min; reruns hit the cache).
+# The filtered/sorted order is memoized on the filter inputs, so paging and starring
+# reruns only slice it.
+articles_df = articles_frame(max_age_days)
+
+filtered = articles_df.iloc[
+    view_positions(articles_df, articles_df.attrs["version"], tuple(choose_topics), start_date, end_date, sort_by)
+]
 
 # =========================
 # Render results + pagination
@@ -477,52 +906,68 @@ filtered = apply_sort([a for a in articles if passes_filters(a)])
 st.markdown(f"## 📌 Results ({len(filtered)} articles)")
 
 PAGE_SIZE = 18
-total_pages = max(1, math.ceil(len(filtered) / PAGE_SIZE))
 if "page" not in st.session_state:
     st.session_state["page"] = 1
 
-current_page = render_pagination(total_pages, state_key="page", window=2, key_prefix="top_")
-
-start = (current_page - 1) * PAGE_SIZE
-end = start + PAGE_SIZE
-page_articles = filtered[start:end]
-
-selected = []
-
-def display_card(article, key_suffix):
-    st.markdown('<div class="news-card">', unsafe_allow_html=True)
-    if article.get("image"):
-        st.image(article["image"], use_column_width=True)
-    st.markdown(f'<div class="news-title">{article["title"]}</div>', unsafe_allow_html=True)
-    date_str = article["date"][:10]
-    dom = article.get("domain", "")
-    st.markdown(f'<div class="news-meta">📅 {date_str} &nbsp;&nbsp;•&nbsp;&nbsp; 🔖 {dom}</div>', unsafe_allow_html=True)
-    chips = " ".join([f'<span class="badge">{t}</span>' for t in article["topics"][:3]])
-    if chips:
-        st.markdown(chips, unsafe_allow_html=True)
-        st.markdown('<hr class="soft">', unsafe_allow_html=True)
-    st.markdown(f'<div class="news-summary">{article["summary"][:320]}...</div>', unsafe_allow_html=True)
-    st.markdown(f"[🔗 Read more]({article['link']})")
-    if st.checkbox("⭐ Add to Top 10", key=f"sel_{article['id']}_{key_suffix}"):
-        selected.append(article)
-    st.markdown("</div>", unsafe_allow_html=True)
-
-for i in range(0, len(page_articles), 3):
-    cols = st.columns(3)
-    for j in range(3):
-        if i + j < len(page_articles):
-            with cols[j]:
-                display_card(page_articles[i + j], key_suffix=f"{i}_{j}")
+# Pager + grid rerun on their own: page clicks don't re-run the sidebar, filtering or export
+@st.experimental_fragment
+def render_results_grid(filtered: pd.DataFrame):
+    total_pages = max(1, math.ceil(len(filtered) / PAGE_SIZE))
+    current_page = render_pagination(total_pages, state_key="page", window=2, key_prefix="top_")
+
+    start = (current_page - 1) * PAGE_SIZE
+    page_cards = filtered["card_html"].iloc[start:start + PAGE_SIZE]
+
+    # One CSS grid for the whole page: the browser lays out the cards, one delta in total
+    st.markdown(
+        '<div class="news-grid">' + "".join(page_cards) + "</div>",
+        unsafe_allow_html=True,
+    )
+
+render_results_grid(filtered)
+
+# Starred article ids (pick order) survive reruns, page and filter changes
+st.session_state.setdefault("top10_ids", [])
+
+def store_top10(widget_key: str):
+    st.session_state["top10_ids"] = list(st.session_state[widget_key])
+
+# One selection widget for the whole result set instead of a checkbox per card.
+# Earlier picks stay among the options so a narrower filter doesn't drop them.
+by_id = articles_by_id(articles_df, articles_df.attrs["version"])
+top10_ids = [i for i in st.session_state["top10_ids"] if i in by_id]  # drop aged-out picks
+pick_options = list(dict.fromkeys(top10_ids + filtered["id"].tolist()))
+st.multiselect(
+    "⭐ Pick up to 10 for the Top 10",
+    pick_options,
+    default=top10_ids,
+    format_func=lambda i: by_id[i]["title"] if i in by_id else i,
+    max_selections=10,
+    key="top10_picker",
+    on_change=store_top10,
+    args=("top10_picker",),
+)
 
 st.divider()
 
+def build_markdown(selected: list[dict]) -> str:
+    parts = ["# Maritime Top 10\n\n"]
+    for idx, a in enumerate(selected[:10], 1):
+        parts.append(
+            f"## {idx}. {a['title']}\n"
+            f"*Date:* {a['date']}\n\n"
+            f"*Topics:* {a['topics_str']}\n\n"
+            f"{a['summary_preview']}...\n\n"
+            f"[Read more]({a['link']})\n\n"
+        )
+    return "".join(parts)
+
+selected = [by_id[i] for i in top10_ids]  # pick order
 if selected:
     st.subheader("📦 Export Top 10 as Markdown")
-    md = "# Maritime Top 10\n\n"
-    for idx, a in enumerate(selected[:10], 1):
-        md += f"## {idx}. {a['title']}\n"
-        md += f"*Date:* {a['date']}\n\n"
-        md += f"*Topics:* {', '.join(a['topics'])}\n\n"
-        md += f"{a['summary'][:300]}...\n\n"
-        md += f"[Read more]({a['link']})\n\n"
-    st.download_button("📥 Download Markdown", md, file_name="top10.md", mime="text/markdown")
+    # Rebuild the payload only when the exported set changes, not on every rerun
+    md_key = tuple(a["id"] for a in selected[:10])
+    if st.session_state.get("md_key") != md_key:
+        st.session_state["md_bytes"] = build_markdown(selected).encode("utf-8")
+        st.session_state["md_key"] = md_key
+    st.download_button("📥 Download Markdown", st.session_state["md_bytes"], file_name="top10.md", mime="text/markdown")